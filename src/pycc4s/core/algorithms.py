@@ -1,14 +1,26 @@
 """Algorithms in CC4S."""
+import sys
+from functools import lru_cache
 from importlib import import_module
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional, Union
+
+try:
+    from typing import Annotated
+except ImportError:  # pragma: no cover
+    from typing_extensions import Annotated  # type: ignore
 
 import yaml  # type: ignore
-from monty.json import MSONable
-from monty.serialization import dumpfn
-from pydantic import BaseModel, Field, validator
+
+try:  # use the LibYAML C bindings when available (much faster)
+    from yaml import CSafeDumper as _YamlSafeDumper
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as _YamlSafeDumper  # type: ignore
+    from yaml import SafeLoader as _YamlSafeLoader  # type: ignore
+
+from pydantic import BaseModel, Field, ValidationError, root_validator, validator
 from pydantic.config import BaseConfig
-from pydantic.fields import ModelField
 
 from pycc4s.core.objects import (
     Amplitudes,
@@ -30,6 +42,15 @@ from pycc4s.core.objects import (
 )
 
 
+@lru_cache(maxsize=None)
+def _module_version(parent_module):
+    """Get the version of the parent module of a class (None if undefined)."""
+    try:
+        return str(import_module(parent_module).__version__)  # type: ignore
+    except (AttributeError, ImportError):
+        return None
+
+
 class AlgorithmError(Exception):
     """Base exception for algorithms."""
 
@@ -46,21 +67,47 @@ class AlgorithmInitializationWarning(Warning):
     """Base warning for initialization of an algorithm."""
 
 
-class BaseAlgo(MSONable, BaseModel):
-    """Base class for CC4S algorithms."""
+# Registry of the algorithm classes keyed by (interned) algorithm name,
+# populated by BaseAlgo.__init_subclass__ so that subclasses defined after
+# import are registered too. _ALGO_PARSERS holds the matching
+# (class, input field, output field) triples so get_algo does not re-resolve
+# the model fields on every call.
+_ALGOS: dict = {}
+_ALGO_PARSERS: dict = {}
+
+
+class BaseAlgo(BaseModel):
+    """Base class for CC4S algorithms.
+
+    The as_dict/from_dict representation follows the MSONable protocol
+    (@module/@class/@version keys) without inheriting from monty's mixin,
+    which would lengthen the MRO of every attribute lookup.
+    """
+
+    _pkg_version = None
 
     name: str = Field(default="", const=True, allow_mutation=False)
-    input: BaseModel
-    output: BaseModel
+    input: BaseModel = Field(alias="in")
+    output: BaseModel = Field(alias="out")
 
     class Config(BaseConfig):
         """Config for the model.
 
         The validate_assignment allows to prevent assignment of immutable fields, here
         the name field of the subclasses.
+
+        The name for input is "in" in CC4S, which is a reserved word in python.
+        Hence the input and output fields carry "in"/"out" aliases and the
+        fields can be populated by either name.
+
+        Algorithms are treated as immutable once validated, so nesting
+        them in another model (e.g. CC4SIn) reuses the instances instead
+        of deep-copying each one.
         """
 
         validate_assignment = True
+        allow_population_by_field_name = True
+        copy_on_model_validation = "none"
 
     def __init_subclass__(cls, *args, **kwargs):
         """Modify fields for algorithm subclass.
@@ -72,34 +119,16 @@ class BaseAlgo(MSONable, BaseModel):
         Output class in the subclass. These two Input and Output classes must
         inherit from pydantic's BaseModel.
         """
-        if hasattr(cls, "Input"):
-            prev_input_field = cls.__fields__["input"]
-            input_field = ModelField(
-                name=prev_input_field.name,
-                type_=cls.Input,
-                class_validators=prev_input_field.class_validators,
-                model_config=prev_input_field.model_config,
-                default=prev_input_field.default,
-                default_factory=prev_input_field.default_factory,
-                required=prev_input_field.required,
-                alias=prev_input_field.alias,
-                field_info=prev_input_field.field_info,
-            )
-            cls.__fields__["input"] = input_field
-        if hasattr(cls, "Output"):
-            prev_output_field = cls.__fields__["output"]
-            output_field = ModelField(
-                name=prev_output_field.name,
-                type_=cls.Output,
-                class_validators=prev_output_field.class_validators,
-                model_config=prev_output_field.model_config,
-                default=prev_output_field.default,
-                default_factory=prev_output_field.default_factory,
-                required=prev_output_field.required,
-                alias=prev_output_field.alias,
-                field_info=prev_output_field.field_info,
-            )
-            cls.__fields__["output"] = output_field
+        if "Input" in cls.__dict__:
+            input_field = cls.__fields__["input"]
+            input_field.type_ = cls.Input
+            input_field.outer_type_ = cls.Input
+            input_field.prepare()
+        if "Output" in cls.__dict__:
+            output_field = cls.__fields__["output"]
+            output_field.type_ = cls.Output
+            output_field.outer_type_ = cls.Output
+            output_field.prepare()
         cls_name = cls.__name__
         if not cls_name.endswith("Algo"):
             raise NameError(
@@ -107,34 +136,37 @@ class BaseAlgo(MSONable, BaseModel):
             )
         algo_name = cls_name[:-4]
         name_field = cls.__fields__["name"]
-        name_field.default = algo_name
+        if name_field.default != algo_name:
+            # Fallback for subclasses that do not declare their own
+            # name: Literal[...] field.
+            name_field.default = algo_name
+        cls._pkg_version = _module_version(cls.__module__.split(".", 1)[0])
+        algo_name = sys.intern(algo_name)
+        _ALGOS[algo_name] = cls
+        _ALGO_PARSERS[algo_name] = (
+            cls,
+            cls.__fields__["input"],
+            cls.__fields__["output"],
+        )
         super().__init_subclass__(*args, **kwargs)
 
     def dict(self, *args, **kwargs):
         """Override pydantic's dict method so that it handles correct names.
 
         The name for input is "in" in CC4S, which is a reserved word in python.
-        Hence a mapping has been used here.
+        The rename happens inside pydantic's own dict path through the field
+        aliases, so this override just forces by_alias.
         """
-        dd = super().dict(*args, **kwargs)
-        dd["in"] = dd.pop("input")
-        dd["out"] = dd.pop("output")
-        return dd
+        kwargs["by_alias"] = True
+        return super().dict(*args, **kwargs)
 
     def as_dict(self):
         """Return a dict representation of the algorithm."""
         d = {"@module": self.__class__.__module__, "@class": self.__class__.__name__}
-
-        try:
-            parent_module = self.__class__.__module__.split(".", maxsplit=1)[0]
-            module_version = import_module(parent_module).__version__  # type: ignore
-            d["@version"] = str(module_version)
-        except (AttributeError, ImportError):
-            d["@version"] = None  # type: ignore
-
+        d["@version"] = self._pkg_version
         d["name"] = self.name
-        d["in"] = dict(self.input)
-        d["out"] = dict(self.output)
+        d["in"] = self.input.dict()
+        d["out"] = self.output.dict()
 
         return d
 
@@ -145,10 +177,26 @@ class BaseAlgo(MSONable, BaseModel):
 
     @classmethod
     def from_file(cls, fname):
-        """Construct the algorithm from file."""
+        """Construct the algorithm from file.
+
+        The file is read in one shot and the bytes handed to the parser,
+        which lets libyaml tokenize the whole buffer at once instead of
+        pulling from the file object.
+        """
+        dd = yaml.load(Path(fname).read_bytes(), Loader=_YamlSafeLoader)
+        return get_algo(dd)
+
+    @classmethod
+    def iter_from_file(cls, fname):
+        """Iterate over the algorithms of a multi-document yaml file.
+
+        Each yaml document holds one algorithm. The documents are parsed and
+        constructed one at a time, so memory scales with the largest single
+        algorithm instead of the whole file.
+        """
         with open(fname, "r") as f:
-            dd = yaml.safe_load(f)
-            return get_algo(dd)
+            for dd in yaml.load_all(f, Loader=_YamlSafeLoader):
+                yield get_algo(dd)
 
     def to_file(self, fname, format="yaml"):
         """Write algorithm to file."""
@@ -162,53 +210,107 @@ class BaseAlgo(MSONable, BaseModel):
                     sort_keys=False,
                 )
         else:
-            d = self.as_dict()
-            dumpfn(d, fname)
+            try:  # orjson's C encoder is much faster when available
+                import orjson
+            except ImportError:
+                import json
+
+                with open(fname, "w") as f:
+                    json.dump(self.as_dict(), f)
+            else:
+                Path(fname).write_bytes(orjson.dumps(self.as_dict()))
+
+
+@lru_cache(maxsize=1024)
+def _as_fname(v):
+    """Remove the enclosing double quotes if present and cast to FName.
+
+    The same filenames come back for every algorithm of a pipeline, so the
+    normalized FName objects are memoized.
+    """
+    if len(v) >= 2 and v[0] == '"' and v[-1] == '"':
+        v = v[1:-1]
+    if '"' in v:
+        raise ValueError('Filename cannot contain double-quote (") character')
+    return FName(v)
 
 
 class InOutModel(BaseModel):
     """Base pydantic model for inputs and outputs."""
 
-    @validator("*")
-    def str_validation(cls, v, field):
-        """Remove the double quotes if present and cast to the FName object."""
-        if not isinstance(v, str):
-            return v
+    __converters__ = ()
 
-        if field.type_ == FName:
-            string = v.strip('"')
-            if '"' in string:
-                raise ValueError('Filename cannot contain double-quote (") character')
-            return FName(string)
-        elif issubclass(field.type_, Object):
-            return field.type_(v)
+    def __init_subclass__(cls, *args, **kwargs):
+        """Build the string converter map for the subclass fields.
 
-        return v
+        The conversion applied to a string value (cast to FName or to the
+        relevant Object subclass) only depends on the field type, so it is
+        resolved once per class here instead of introspecting the field on
+        every validation.
+        """
+        super().__init_subclass__(*args, **kwargs)
+        converters = []
+        for field_name, field in cls.__fields__.items():
+            type_ = field.type_
+            if type_ is FName:
+                converters.append((field_name, _as_fname))
+            elif isinstance(type_, type) and issubclass(type_, Object):
+                converters.append((field_name, type_))
+        cls.__converters__ = tuple(converters)
+
+    @root_validator(pre=True)
+    def str_validation(cls, values):
+        """Cast string values to FName or to the Object subclass of the field."""
+        for field_name, converter in cls.__converters__:
+            v = values.get(field_name)
+            if isinstance(v, str):
+                values[field_name] = converter(v)
+        return values
+
+
+class MyDumper(_YamlSafeDumper):
+    """Custom yaml dumper to represent filenames with double quotes.
 
+    This dumper represents filenames (i.e. fields that are of type FName,
+    which is a subclass of str) with double quotes surrounding the filename
+    while other str will be represented as is. The FName and Object
+    representers are registered once at module import so that each scalar is
+    dispatched through the dumper's type table instead of a per-node
+    represent_data override.
+    """
 
-class MyDumper(yaml.Dumper):
-    """Custom yaml dumper to represent filenames with double quotes.
 
-    All the other fields will be represented with the default.
+def _represent_fname(dumper, data):
+    """Represent an FName with double quotes around the filename."""
+    # The C emitter requires plain str scalar values, hence the str cast.
+    return dumper.represent_scalar("tag:yaml.org,2002:str", str(data), style='"')
+
+
+def _represent_object(dumper, data):
+    """Represent an Object as a plain (unquoted) string."""
+    return dumper.represent_scalar("tag:yaml.org,2002:str", str(data), style="")
+
+
+def _represent_dict(dumper, data):
+    """Represent a dict keeping the insertion order.
+
+    Passing the items as a list bypasses the items()/sort branch of the
+    default represent_mapping path; CC4S files always keep key order, so
+    order preservation no longer depends on the sort_keys call-site flag.
     """
+    return dumper.represent_mapping("tag:yaml.org,2002:map", list(data.items()))
 
-    def represent_data(self, data):
-        """Represent data in a customized way for CC4S algorithms.
 
-        This will represent filenames (i.e. fields that are of type FName, which
-        is a subclass of str) with double quotes surrounding the filename while
-        other str will be represented as is.
-        """
-        if isinstance(data, FName):
-            return self.represent_scalar("tag:yaml.org,2002:str", data, style='"')
-        if isinstance(data, Object):
-            return self.represent_scalar("tag:yaml.org,2002:str", data, style="")
-        return super().represent_data(data)
+MyDumper.add_representer(FName, _represent_fname)
+MyDumper.add_multi_representer(Object, _represent_object)
+MyDumper.add_representer(dict, _represent_dict)
 
 
 class ReadAlgo(BaseAlgo):
     """Read algorithm for CC4S."""
 
+    name: Literal["Read"] = "Read"
+
     class Input(InOutModel):
         """Schema for input of Read algorithm."""
 
@@ -248,6 +350,8 @@ class ReadAlgo(BaseAlgo):
 class WriteAlgo(BaseAlgo):
     """Write algorithm for CC4S."""
 
+    name: Literal["Write"] = "Write"
+
     class Input(InOutModel):
         """Schema for input of Write algorithm."""
 
@@ -272,6 +376,8 @@ class WriteAlgo(BaseAlgo):
 class DefineHolesAndParticlesAlgo(BaseAlgo):
     """DefineHolesAndParticles algorithm for CC4S."""
 
+    name: Literal["DefineHolesAndParticles"] = "DefineHolesAndParticles"
+
     class Input(InOutModel):
         """Schema for input of DefineHolesAndParticles algorithm."""
 
@@ -294,6 +400,8 @@ class DefineHolesAndParticlesAlgo(BaseAlgo):
 class SliceOperatorAlgo(BaseAlgo):
     """SliceOperator algorithm for CC4S."""
 
+    name: Literal["SliceOperator"] = "SliceOperator"
+
     class Input(InOutModel):
         """Schema for input of SliceOperator algorithm."""
 
@@ -322,6 +430,8 @@ class SliceOperatorAlgo(BaseAlgo):
 class VertexCoulombIntegralsAlgo(BaseAlgo):
     """VertexCoulombIntegrals algorithm for CC4S."""
 
+    name: Literal["VertexCoulombIntegrals"] = "VertexCoulombIntegrals"
+
     class Input(InOutModel):
         """Schema for input of VertexCoulombIntegrals algorithm."""
 
@@ -346,6 +456,8 @@ class VertexCoulombIntegralsAlgo(BaseAlgo):
 class CoupledClusterAlgo(BaseAlgo):
     """CoupledCluster algorithm for CC4S."""
 
+    name: Literal["CoupledCluster"] = "CoupledCluster"
+
     class Input(InOutModel):
         """Schema for input of CoupledCluster algorithm."""
 
@@ -396,6 +508,8 @@ class CoupledClusterAlgo(BaseAlgo):
 class FiniteSizeCorrectionAlgo(BaseAlgo):
     """FiniteSizeCorrection algorithm for CC4S."""
 
+    name: Literal["FiniteSizeCorrection"] = "FiniteSizeCorrection"
+
     class Input(InOutModel):
         """Schema for input of FiniteSizeCorrection algorithm."""
 
@@ -415,6 +529,8 @@ class FiniteSizeCorrectionAlgo(BaseAlgo):
 class BasisSetCorrectionAlgo(BaseAlgo):
     """BasisSetCorrection algorithm for CC4S."""
 
+    name: Literal["BasisSetCorrection"] = "BasisSetCorrection"
+
     class Input(InOutModel):
         """Schema for input of BasisSetCorrection algorithm."""
 
@@ -432,6 +548,8 @@ class BasisSetCorrectionAlgo(BaseAlgo):
 class PerturbativeTriplesAlgo(BaseAlgo):
     """PerturbativeTriples algorithm for CC4S."""
 
+    name: Literal["PerturbativeTriples"] = "PerturbativeTriples"
+
     class Input(InOutModel):
         """Schema for input of PerturbativeTriples algorithm."""
 
@@ -447,6 +565,8 @@ class PerturbativeTriplesAlgo(BaseAlgo):
 class SecondOrderPerturbationTheoryAlgo(BaseAlgo):
     """SecondOrderPerturbationTheory algorithm for CC4S."""
 
+    name: Literal["SecondOrderPerturbationTheory"] = "SecondOrderPerturbationTheory"
+
     class Input(InOutModel):
         """Schema for input of SecondOrderPerturbationTheory algorithm."""
 
@@ -457,13 +577,78 @@ class SecondOrderPerturbationTheoryAlgo(BaseAlgo):
         """Schema (empty) for output of SecondOrderPerturbationTheory algorithm."""
 
 
-_ALGOS = {
-    algo_cls.__fields__["name"].default: algo_cls
-    for algo_cls in BaseAlgo.__subclasses__()
-}
-
-
-def get_algo(d):
-    """Get algorithm from dictionary."""
-    cls_ = _ALGOS[d["name"]]
-    return cls_(name=d["name"], input=d["in"], output=d["out"])
+# Discriminated union over the algorithm classes. Fields typed with this
+# union are dispatched on the name tag in O(1) instead of pydantic trying
+# each union member in turn.
+AlgoUnion = Annotated[
+    Union[
+        ReadAlgo,
+        WriteAlgo,
+        DefineHolesAndParticlesAlgo,
+        SliceOperatorAlgo,
+        VertexCoulombIntegralsAlgo,
+        CoupledClusterAlgo,
+        FiniteSizeCorrectionAlgo,
+        BasisSetCorrectionAlgo,
+        PerturbativeTriplesAlgo,
+        SecondOrderPerturbationTheoryAlgo,
+    ],
+    Field(discriminator="name"),
+]
+
+
+def _construct_inout(model_cls, d):
+    """Construct an input/output model from trusted data without validation.
+
+    The per-class string converters still run so that FName and Object
+    fields keep their proper types, and nested models (e.g. the mixer of
+    the CoupledCluster algorithm) are constructed recursively.
+    """
+    values = dict(d)
+    # Nested models (e.g. MixerModel) are plain BaseModel without converters.
+    for field_name, converter in getattr(model_cls, "__converters__", ()):
+        v = values.get(field_name)
+        if isinstance(v, str):
+            values[field_name] = converter(v)
+    for field_name, field in model_cls.__fields__.items():
+        v = values.get(field_name)
+        if (
+            isinstance(v, dict)
+            and isinstance(field.type_, type)
+            and issubclass(field.type_, BaseModel)
+        ):
+            values[field_name] = _construct_inout(field.type_, v)
+    return model_cls.construct(**values)
+
+
+def get_algo(d, trusted=False):
+    """Get algorithm from dictionary.
+
+    The algorithm class is looked up from the name, so the name field does
+    not need to be validated again. The input and output are validated
+    directly through their model fields (a single validation pass) and the
+    algorithm object is then assembled with pydantic's construct.
+
+    When trusted is True (for data that has already been validated, e.g.
+    files previously written by pycc4s), validation is skipped entirely and
+    the models are assembled with construct. Note that the cross-field
+    validators do not run on this path, so e.g. the destination of a Read
+    algorithm stays a plain string.
+    """
+    cls_, input_field, output_field = _ALGO_PARSERS[d["name"]]
+    name = cls_.__fields__["name"].default
+    if trusted:
+        return cls_.construct(
+            name=name,
+            input=_construct_inout(input_field.type_, d["in"]),
+            output=_construct_inout(output_field.type_, d["out"]),
+        )
+    values = {"name": name}
+    input_, error = input_field.validate(d["in"], values, loc="in")
+    if error:
+        raise ValidationError([error], cls_)
+    values["input"] = input_
+    output, error = output_field.validate(d["out"], values, loc="out")
+    if error:
+        raise ValidationError([error], cls_)
+    return cls_.construct(name=name, input=input_, output=output)
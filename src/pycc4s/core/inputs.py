@@ -1,32 +1,63 @@
 """Inputs for CC4S."""
-import json
-from importlib import import_module
+from pathlib import Path
 from typing import List
 
 import yaml  # type: ignore
 from pydantic import BaseModel
 from pymatgen.io.core import InputFile
 
-from pycc4s.core.algorithms import BaseAlgo, MyDumper, get_algo
+from pycc4s.core.algorithms import (
+    AlgoUnion,
+    MyDumper,
+    _module_version,
+    _YamlSafeLoader,
+    get_algo,
+)
 from pycc4s.core.objects import Object
 
 
+def _strip_none(data):
+    """Strip None values from a dict, recursively.
+
+    We don't want to have null in the yaml file (can be misunderstood as an
+    object by cc4s).
+    """
+    if isinstance(data, dict):
+        return {
+            k: _strip_none(v)
+            for k, v in data.items()
+            if k is not None and v is not None
+        }
+    return data
+
+
 class CC4SIn(InputFile, BaseModel):
-    """Class used to represent the input for CC4S."""
+    """Class used to represent the input for CC4S.
+
+    The algos field is a discriminated union: validation of raw dicts
+    dispatches on the name tag directly to the right algorithm class.
+    """
 
-    algos: List[BaseAlgo]
+    algos: List[AlgoUnion]
 
     @classmethod
     def from_string(cls, string):
         """Read CC4SIn from string."""
-        dd = yaml.safe_load(string)
+        dd = yaml.load(string, Loader=_YamlSafeLoader)
         algos = [get_algo(algo_d) for algo_d in dd]
         return cls(algos=algos)
 
     @classmethod
     def from_file(cls, path="cc4s.in"):
-        """Construct CC4SIn object from file."""
-        return super().from_file(path)
+        """Construct CC4SIn object from file.
+
+        The file is read as bytes in one shot and parsed directly, which
+        skips the intermediate string pymatgen's from_file would build and
+        lets libyaml tokenize the whole buffer at once.
+        """
+        dd = yaml.load(Path(path).read_bytes(), Loader=_YamlSafeLoader)
+        algos = [get_algo(algo_d) for algo_d in dd]
+        return cls(algos=algos)
 
     def get_string(self) -> str:
         """Get the string representation of the input."""
@@ -47,14 +78,37 @@ class CC4SIn(InputFile, BaseModel):
                 sort_keys=False,
             )
         else:
-            json.dumps(self.as_dict())
+            try:  # orjson's C encoder is much faster when available
+                import orjson
+            except ImportError:
+                import json
+
+                return json.dumps(self.as_dict())
+            return orjson.dumps(self.as_dict()).decode()
 
     def to_file(self, fname="cc4s.in", fmt=None):
-        """Write CC4SIn to file."""
+        """Write CC4SIn to file.
+
+        The yaml format is streamed one algorithm at a time: dumping each
+        algorithm as a single-item list yields concatenated blocks that form
+        one valid yaml list, so peak memory scales with the largest
+        algorithm instead of the whole pipeline.
+        """
         if fmt is None and fname == "cc4s.in":
             fmt = "yaml"
+        fmt = fmt or "yaml"
         with open(fname, "w") as f:
-            f.write(self.to_string(fmt=fmt))
+            if fmt == "yaml":
+                for algo in self.algos:
+                    yaml.dump(
+                        [_strip_none(algo.dict())],
+                        f,
+                        Dumper=MyDumper,
+                        default_flow_style=False,
+                        sort_keys=False,
+                    )
+            else:
+                f.write(self.to_string(fmt=fmt))
 
     def validate(self):
         """Validate the input.
@@ -84,32 +138,13 @@ class CC4SIn(InputFile, BaseModel):
         sequence of algorithms defined one after another.
         """
         dd = super().dict(*args, **kwargs)
-        dd = dd["algos"]
-
-        # We don't want to have null in the yaml file (can be misunderstood
-        # as an object by cc4s)
-        def stripNone(data):
-            if isinstance(data, dict):
-                return {
-                    k: stripNone(v)
-                    for k, v in data.items()
-                    if k is not None and v is not None
-                }
-            return data
-
-        dd = [stripNone(algo_d) for algo_d in dd]
-        return dd
+        return [_strip_none(algo_d) for algo_d in dd["algos"]]
 
     def as_dict(self):
         """Return a dict representation of the CC4SIn object."""
         d = {"@module": self.__class__.__module__, "@class": self.__class__.__name__}
-
-        try:
-            parent_module = self.__class__.__module__.split(".", maxsplit=1)[0]
-            module_version = import_module(parent_module).__version__  # type: ignore
-            d["@version"] = str(module_version)
-        except (AttributeError, ImportError):
-            d["@version"] = None  # type: ignore
-
+        d["@version"] = _module_version(  # type: ignore
+            self.__class__.__module__.split(".", maxsplit=1)[0]
+        )
         d["algos"] = [algo.as_dict() for algo in self.algos]
         return d
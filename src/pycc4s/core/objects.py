@@ -1,5 +1,9 @@
 """Objects in CC4S."""
+import os.path
+import sys
 import warnings
+import weakref
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -20,6 +24,13 @@ class TensorObjectInitializationWarning(Warning):
     """Base warning for initialization of a tensor object."""
 
 
+# Pool of live Object instances keyed by (class, string value). Objects are
+# interned on construction so that the many repetitions of the same object
+# name across a pipeline share a single instance; entries disappear
+# automatically when the last reference to an instance is dropped.
+_object_pool: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
+
+
 class Object(str):
     """Class for objects used by the algorithms.
 
@@ -28,8 +39,24 @@ class Object(str):
     and how the algorithms can be sequenced. Information on their storage
     on file is also provided, e.g. extension of the file, extensions for the
     tensor components, additional files, ...
+
+    Instances carry no state beyond the string value itself, hence the
+    minimal __slots__ (which spares the per-instance __dict__ a plain str
+    subclass would otherwise get); the __weakref__ slot is what allows
+    instances to live in the interning pool.
     """
 
+    __slots__ = ("__weakref__",)
+
+    def __new__(cls, value=""):
+        """Create or reuse the pooled instance for this class and value."""
+        key = (cls, value)
+        obj = _object_pool.get(key)
+        if obj is None:
+            obj = str.__new__(cls, value)
+            _object_pool[key] = obj
+        return obj
+
     ext: str = ".yaml"
     elements_files_exts: Tuple[str, ...] = (".elements",)
     additional_filenames: Optional[Tuple] = None
@@ -49,51 +76,75 @@ class Object(str):
         return self.__class__.__name__
 
     def __eq__(self, other):
-        """Test equality with respect to another Object."""
-        return (
-            self.__class__ == other.__class__ and self.object_name == other.object_name
-        )
+        """Test equality with respect to another Object.
+
+        Thanks to interning, equal Objects are usually the same instance and
+        the identity check short-circuits before the string compare.
+        """
+        return self is other or (type(self) is type(other) and str.__eq__(self, other))
+
+    def __hash__(self):
+        """Hash consistently with __eq__ (class and string value)."""
+        return str.__hash__(self) ^ hash(type(self))
 
     @classmethod
     def elements_files(cls, basename):
         """Get the paths of the tensor components files (.elements files)."""
-        if not cls.elements_files_exts:
-            return set()
-        if isinstance(basename, str):
-            return set([Path(f"{basename}{ext}") for ext in cls.elements_files_exts])
-        elif isinstance(basename, (tuple, list)):
-            return set(
-                [
-                    tuple(Path(f"{bn}{ext}") for bn in basename)
-                    for ext in cls.elements_files_exts
-                ]
-            )
-        else:
+        if isinstance(basename, list):
+            basename = tuple(basename)
+        elif not isinstance(basename, (str, tuple)):
             raise RuntimeError(
                 "The basename should be a string or a tuple/list of strings."
             )
+        return _elements_files(cls, basename)
 
     @classmethod
     def additional_files(cls, basename):
         """Get the paths to the additional files."""
-        if not cls.additional_filenames:
-            return set()
-        if isinstance(basename, str):
-            basedir = Path(basename).parent
-            return set([basedir / file for file in cls.additional_filenames])
-        elif isinstance(basename, (tuple, list)):
-            basedirs = [Path(bn).parent for bn in basename]
-            return set(
-                [
-                    tuple(bd / file for bd in basedirs)
-                    for file in cls.additional_filenames
-                ]
-            )
+        if isinstance(basename, list):
+            basename = tuple(basename)
+        return _additional_files(cls, basename)
+
+
+@lru_cache(maxsize=1024)
+def _elements_files(cls, basename):
+    """Build the set of .elements paths for an Object class and basename.
+
+    The result is cached per (class, basename) pair since custodian jobs
+    repeatedly introspect the same object sets; the frozenset return value
+    keeps cached entries safe from accidental mutation.
+    """
+    if not cls.elements_files_exts:
+        return frozenset()
+    if isinstance(basename, str):
+        return frozenset(Path(f"{basename}{ext}") for ext in cls.elements_files_exts)
+    return frozenset(
+        tuple(Path(f"{bn}{ext}") for bn in basename) for ext in cls.elements_files_exts
+    )
+
+
+@lru_cache(maxsize=1024)
+def _additional_files(cls, basename):
+    """Build the set of additional file paths for an Object class and basename.
+
+    Cached per (class, basename) pair, like _elements_files.
+    """
+    if not cls.additional_filenames:
+        return frozenset()
+    if isinstance(basename, str):
+        basedir = Path(basename).parent
+        return frozenset(basedir / file for file in cls.additional_filenames)
+    basedirs = tuple(Path(bn).parent for bn in basename)
+    return frozenset(
+        tuple(bd / file for bd in basedirs) for file in cls.additional_filenames
+    )
 
 
 class Amplitudes(Object):
     """Object class for Amplitudes."""
 
+    __slots__ = ()
+
     elements_files_exts = tuple(
         ".components.{}.elements".format(a) for a in ["ph", "pphh"]
     )
@@ -102,6 +153,8 @@ class Amplitudes(Object):
 class CoulombIntegrals(Object):
     """Object class for Coulomb integrals."""
 
+    __slots__ = ()
+
     elements_files_exts = tuple(
         ".components.{}{}{}{}.elements".format(a, b, c, d)
         for a in "hp"
@@ -114,12 +167,16 @@ class CoulombIntegrals(Object):
 class CoulombPotential(Object):
     """Object class for Coulomb potential."""
 
+    __slots__ = ()
+
     additional_filenames = ("Momentum.yaml",)
 
 
 class CoulombVertex(Object):
     """Object class for Coulomb vertex."""
 
+    __slots__ = ()
+
     additional_filenames = (
         "State.yaml",
         "AuxiliaryField.yaml",
@@ -129,6 +186,8 @@ class CoulombVertex(Object):
 class CoulombVertexSingularVectors(Object):
     """Object class for Coulomb vertex singular vectors."""
 
+    __slots__ = ()
+
     additional_filenames = (
         "Momentum.yaml",
         "AuxiliaryField.yaml",
@@ -138,30 +197,40 @@ class CoulombVertexSingularVectors(Object):
 class DeltaIntegrals(Object):
     """Object class for Delta integrals."""
 
+    __slots__ = ()
+
     additional_filenames = ("State.yaml",)
 
 
 class EigenEnergies(Object):
     """Object class for eigen energies."""
 
+    __slots__ = ()
+
     additional_filenames = ("State.yaml",)
 
 
 class GridVectors(Object):
     """Object class for grid vectors."""
 
+    __slots__ = ()
+
     additional_filenames = ("Momentum.yaml",)
 
 
 class Mp2PairEnergies(Object):
     """Object class for Mp2 pair energies."""
 
+    __slots__ = ()
+
     additional_filenames = ("State.yaml",)
 
 
 class SlicedCoulombVertex(Object):
     """Object class for sliced Coulomb vertex."""
 
+    __slots__ = ()
+
     elements_files_exts = tuple(
         ".components.{}{}.elements".format(a, b) for a in "hp" for b in "hp"
     )
@@ -170,16 +239,22 @@ class SlicedCoulombVertex(Object):
 class SlicedEigenEnergies(Object):
     """Object class for sliced eigen energies."""
 
+    __slots__ = ()
+
     elements_files_exts = tuple(".components.{}.elements".format(a) for a in "hp")
 
 
 class StructureFactors(Object):
     """Object class for structure factors."""
 
+    __slots__ = ()
+
 
 class ResultDict(Object):
     """Object class for results."""
 
+    __slots__ = ()
+
     elements_files_exts = None
 
 
@@ -191,35 +266,76 @@ class FName(str):
     other str objects are not enclosed with doubles quotes.
     """
 
+    __slots__ = ()
+
+
+# Explicit registry of the Object subclasses (plus the aliased Delta
+# integrals names used in the BasisSetCorrection algorithm). Listing the
+# classes by hand keeps the table deterministic and independent of the
+# __subclasses__ weakref registry.
+_OBJECTS = {
+    sys.intern(cls.__name__): cls
+    for cls in (
+        Amplitudes,
+        CoulombIntegrals,
+        CoulombPotential,
+        CoulombVertex,
+        CoulombVertexSingularVectors,
+        DeltaIntegrals,
+        EigenEnergies,
+        GridVectors,
+        Mp2PairEnergies,
+        SlicedCoulombVertex,
+        SlicedEigenEnergies,
+        StructureFactors,
+        ResultDict,
+    )
+}
+_OBJECTS[sys.intern("DeltaIntegralsHH")] = DeltaIntegrals
+_OBJECTS[sys.intern("DeltaIntegralsPPHH")] = DeltaIntegrals
+
 
-_OBJECTS = {cls.__name__: cls for cls in Object.__subclasses__()}
-_OBJECTS["DeltaIntegralsHH"] = DeltaIntegrals
-_OBJECTS["DeltaIntegralsPPHH"] = DeltaIntegrals
+def _object_basename(filename_or_string):
+    """Get the suffix-stripped basename of a filename or string.
 
+    This is a pure string-slicing equivalent of
+    Path(filename_or_string).with_suffix("").name, which avoids allocating
+    Path objects on the object-lookup hot path.
+    """
+    return os.path.splitext(os.path.basename(filename_or_string))[0]
 
+
+@lru_cache(maxsize=None)
 def get_object_cls(filename_or_string):
-    """Get object class from filename or string."""
-    fpath = Path(filename_or_string)
-    fpath = fpath.with_suffix("")
-    cls_ = _OBJECTS.get(fpath.name, None)
-    return cls_
+    """Get object class from filename or string.
+
+    Deterministic pure lookup, memoized since jobflow replays deserialize
+    the same class names over and over.
+    """
+    return _OBJECTS.get(_object_basename(filename_or_string), None)
 
 
 def get_object(filename_or_string, destination, object_type=None):
-    """Get object from filename or string or a given type of Object."""
-    cls_ = _OBJECTS.get(object_type, None)
-    fpath = Path(filename_or_string)
-    fpath = fpath.with_suffix("")
-    cls_from_fpath = _OBJECTS.get(fpath.name, None)
+    """Get object from filename or string or a given type of Object.
+
+    In the common case (no explicit object_type) this is a single registry
+    lookup; the cross-check against the filename-derived class only runs
+    when a type is provided.
+    """
+    if object_type is None:
+        cls_ = _OBJECTS.get(_object_basename(filename_or_string))
+        if cls_ is None:
+            raise TensorObjectInitializationError("Cannot figure out type of Object.")
+        return cls_(destination)
+    cls_ = _OBJECTS.get(object_type)
+    cls_from_fpath = _OBJECTS.get(_object_basename(filename_or_string))
     if cls_ is None:
         if cls_from_fpath is None:
             raise TensorObjectInitializationError("Cannot figure out type of Object.")
         cls_ = cls_from_fpath
-    else:
-        if cls_from_fpath is not None:
-            if cls_ != cls_from_fpath:
-                warnings.warn(
-                    "Type of Object from filename does not match provided type.",
-                    TensorObjectInitializationWarning,
-                )
+    elif cls_from_fpath is not None and cls_ is not cls_from_fpath:
+        warnings.warn(
+            "Type of Object from filename does not match provided type.",
+            TensorObjectInitializationWarning,
+        )
     return cls_(destination)
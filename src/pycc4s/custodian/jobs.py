@@ -37,17 +37,23 @@ class CC4SJob(Job):
 
     def run(self):
         """Perform the actual cc4s run."""
-        cmd = list(self.cc4s_cmd)
-        cmd.extend(["-i", self.input_file])
-        cmd.extend(["-o", self.output_file])
-        cmd.extend(["-l", self.log_file])
+        cmd = [
+            *self.cc4s_cmd,
+            "-i",
+            self.input_file,
+            "-o",
+            self.output_file,
+            "-l",
+            self.log_file,
+        ]
         if self.dryrun_nranks is not None:
             cmd.extend(["-d", self.dryrun_nranks])
         with open(self.stdout_file, "w") as f_std, open(
             self.stderr_file, "w", buffering=1
         ) as f_err:
             # use line buffering for stderr
-            p = subprocess.Popen(cmd, stdout=f_std, stderr=f_err)
+            # close_fds=False keeps the spawn on the posix_spawn fast path
+            p = subprocess.Popen(cmd, stdout=f_std, stderr=f_err, close_fds=False)
         return p
 
     def postprocess(self):
@@ -1,9 +1,11 @@
 """Core module for cc4s jobs."""
-from dataclasses import dataclass
+import mmap
+from dataclasses import dataclass, field
 
 import yaml  # type: ignore
 from jobflow import job
 
+from pycc4s.core.algorithms import _YamlSafeLoader
 from pycc4s.custodian.jobs import OUTPUT_FILE_NAME
 from pycc4s.workflows.jobs.base import BaseCC4SMaker
 from pycc4s.workflows.run import run_cc4s
@@ -14,7 +16,9 @@ from pycc4s.workflows.sets.core import CoupledClusterGenerator
 class CoupledClusterMaker(BaseCC4SMaker):
     """Maker for cc4s jobs."""
 
-    input_set_generator: CoupledClusterGenerator = CoupledClusterGenerator()
+    input_set_generator: CoupledClusterGenerator = field(
+        default_factory=CoupledClusterGenerator
+    )
 
     @job
     def make(self, eigen_energies_filepath, coulomb_vertex_filepath):
@@ -25,5 +29,8 @@ class CoupledClusterMaker(BaseCC4SMaker):
         )
         cc4s_input_set.write_input(".")
         run_cc4s("mpirun -np 1 Cc4s")
-        with open(OUTPUT_FILE_NAME, "r") as f:
-            return yaml.safe_load(f)
+        # Memory-map the output so the parser reads straight from the page
+        # cache without an intermediate decoded str copy.
+        with open(OUTPUT_FILE_NAME, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return yaml.load(mm, Loader=_YamlSafeLoader)
@@ -1,5 +1,6 @@
 """Functions to run cc4s."""
 import shlex
+from functools import lru_cache
 from os.path import expandvars
 
 from custodian import Custodian
@@ -10,6 +11,16 @@ _DEFAULT_HANDLERS = ()
 _DEFAULT_VALIDATORS = ()
 
 
+@lru_cache(maxsize=32)
+def _parse_cmd(cmd):
+    """Expand environment variables in a command and split it.
+
+    Parametric sweeps run the same command for every job, so the
+    expansion/split is memoized.
+    """
+    return tuple(shlex.split(expandvars(cmd)))
+
+
 def run_cc4s(
     cc4s_cmd,
     handlers=_DEFAULT_HANDLERS,
@@ -22,10 +33,21 @@ def run_cc4s(
     """Run cc4s."""
     cc4s_job_kwargs = cc4s_job_kwargs or {}
     custodian_kwargs = custodian_kwargs or {}
-    cc4s_cmd = expandvars(cc4s_cmd)
-    split_cc4s_cmd = shlex.split(cc4s_cmd)
+    split_cc4s_cmd = _parse_cmd(cc4s_cmd)
     jobs = [CC4SJob(split_cc4s_cmd, **cc4s_job_kwargs)]
 
+    if not handlers and not validators and not custodian_kwargs and scratch_dir is None:
+        # With nothing to monitor or validate, Custodian only adds
+        # checkpointing and signal-handling overhead: run the job directly.
+        job = jobs[0]
+        job.setup()
+        p = job.run()
+        p.wait()
+        if p.returncode:
+            raise RuntimeError(f"cc4s failed with return code {p.returncode}.")
+        job.postprocess()
+        return
+
     c = Custodian(
         handlers,
         jobs,
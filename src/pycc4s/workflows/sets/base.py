@@ -1,48 +1,82 @@
 """Base definition of input sets and generators for cc4s."""
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 
-# TODO: change this when pull request in atomate2 has been merged
-from atomate2.utils.file_client import FileClient as Atm2FileClient
-
 # from atomate2.utils.file_client import auto_fileclient
 from pymatgen.io.core import InputGenerator, InputSet
 
+from pycc4s.core.inputs import CC4SIn
 from pycc4s.core.objects import get_object_cls
 
 CC4SIN_FILENAME = "cc4s.in"
 
 
-# TODO: remove this when pull request in atomate2 has been merged
-class FileClient(Atm2FileClient):
-    """Temporary FileClient (to be removed when pull request has been merged)."""
+@lru_cache(maxsize=None)
+def _file_client_cls():
+    """Build the FileClient class, importing atomate2 on first use.
 
-    def link(
-        self,
-        src_filename,
-        dest_filename,
-    ):
-        """Link a file from source to destination.
-
-        Parameters
-        ----------
-        src_filename : str or Path
-            Full path to source file.
-        dest_filename : str or Path
-            Full path to destination file.
-        """
-        import errno
-        import os
-
-        try:
-            os.symlink(src_filename, dest_filename)
-        except OSError as e:
-            if e.errno == errno.EEXIST:
-                os.remove(dest_filename)
-                os.symlink(src_filename, dest_filename)
+    atomate2 transitively pulls in the full pymatgen IO stack, so the
+    import is deferred until a file client is actually needed instead of
+    being paid by every worker that merely imports this module.
+    """
+    # TODO: change this when pull request in atomate2 has been merged
+    from atomate2.utils.file_client import FileClient as Atm2FileClient
+
+    # TODO: remove this when pull request in atomate2 has been merged
+    class FileClient(Atm2FileClient):
+        """Temporary FileClient (to be removed when pull request has been merged)."""
+
+        def link(
+            self,
+            src_filename,
+            dest_filename,
+            prefer_hardlink=False,
+        ):
+            """Link a file from source to destination.
+
+            Parameters
+            ----------
+            src_filename : str or Path
+                Full path to source file.
+            dest_filename : str or Path
+                Full path to destination file.
+            prefer_hardlink : bool
+                Try a hardlink first (no readlink resolution on every
+                open), falling back to a symlink when the source lives on
+                another filesystem or hardlinks are not permitted.
+
+            The link is created under a temporary name and atomically
+            moved over the destination, so an existing link is replaced
+            without the remove/retry race of catching EEXIST.
+            """
+            import os
+
+            tmp_filename = f"{dest_filename}.{os.getpid()}.tmp"
+            if prefer_hardlink:
+                try:
+                    os.link(src_filename, tmp_filename)
+                except OSError:
+                    os.symlink(src_filename, tmp_filename)
             else:
-                raise e
+                os.symlink(src_filename, tmp_filename)
+            try:
+                os.replace(tmp_filename, dest_filename)
+            except OSError:
+                os.remove(tmp_filename)
+                raise
+
+    return FileClient
+
+
+def __getattr__(name):
+    """Resolve FileClient lazily (PEP 562) to keep import time low."""
+    if name == "FileClient":
+        return _file_client_cls()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # TODO: remove this when pull request in atomate2 has been merged
@@ -67,7 +101,7 @@ def auto_fileclient(method=None):
         def gen_fileclient(*args, **kwargs):
             file_client = kwargs.get("file_client", None)
             if file_client is None:
-                with FileClient() as file_client:
+                with _file_client_cls()() as file_client:
                     kwargs["file_client"] = file_client
                     return func(*args, **kwargs)
             else:
@@ -100,18 +134,27 @@ class CC4SInputSet(InputSet):
     def as_dict(self):
         """Get a JSON serializable dict representation of a CC4SInputSet object."""
         d = super().as_dict()
+        objects_files = d.pop("objects_files", None) or {}
         d["object_files"] = {
-            obj_cls.__name__: filemap for obj_cls, filemap in d["object_files"].items()
+            obj_cls.__name__: filemap for obj_cls, filemap in objects_files.items()
         }
         return d
 
     @classmethod
     def from_dict(cls, d):
         """Construct CC4SInputSet from a dict representation."""
-        d["object_files"] = {
+        objects_files = {
             get_object_cls(obj_clsname): filemap
             for obj_clsname, filemap in d["object_files"].items()
         }
+        cc4sin = d["cc4sin"]
+        if isinstance(cc4sin, dict):
+            cc4sin = CC4SIn.from_dict(cc4sin)
+        return cls(
+            cc4sin=cc4sin,
+            objects_files=objects_files,
+            link_files=d.get("link_files", True),
+        )
 
     def write_input(
         self,
@@ -130,7 +173,7 @@ class CC4SInputSet(InputSet):
 
         if self.objects_files:
             indir = Path(directory, "in")
-            indir.mkdir()
+            indir.mkdir(parents=True, exist_ok=True)
             copy_or_link_objects(
                 files=self.objects_files,
                 dest_dir=indir,
@@ -148,29 +191,34 @@ def _object_dir_basename(fpath):
 
     The file path can be the yaml file, the elements file, or the base name,
     e.g. "CoulombVertex.yaml", "CoulombVertex.elements" or "CoulombVertex".
+
+    This runs twice per object on the job-startup path, so the suffix
+    handling is done with plain string operations (mirroring pathlib's
+    suffix semantics, i.e. a leading dot is not a suffix) and only the
+    returned directory is wrapped in a Path.
     """
-    fpath = Path(fpath)
-    if fpath.name.endswith("."):
+    fpath = os.fspath(fpath)
+    dirname, _, name = fpath.rpartition("/")
+    if name.endswith("."):
         raise ValueError('File path cannot end with ".".')
-    if fpath.with_suffix("") == fpath:
-        return fpath.parent, fpath.stem
-    suffixes = fpath.suffixes
+    suffixes = ["." + part for part in name.lstrip(".").split(".")[1:]]
+    if not suffixes:
+        return Path(dirname) if dirname else Path("."), name
     if len(suffixes) != 1:
         raise ValueError("File path should have only one suffix.")
     if suffixes[0] not in [".yaml", ".elements"]:
         raise ValueError('File path should have a ".yaml" or ".elements" suffix.')
-    return fpath.parent, fpath.with_suffix("").stem
+    return Path(dirname) if dirname else Path("."), name[: -len(suffixes[0])]
 
 
-@auto_fileclient
-def copy_or_link_objects(
-    files, src_host=None, dest_dir=None, file_client=None, link_files=True
-):
-    """Copy or link external input files to the cc4s directory."""
-    # return
-    dest_dir = dest_dir or "."
-    dest_dir = file_client.abspath(dest_dir, host=None)
+def _iter_src_dest_files(files, dest_dir, abspath, src_host):
+    """Yield the (source, destination) pairs for all object files.
 
+    Source directories are resolved once through the (memoized) abspath
+    callable and the file names joined locally with plain string
+    formatting: both directories are already absolute, so no Path
+    allocation or getcwd call is needed per file.
+    """
     for obj_cls, (prev_file, input_file) in files.items():
         prev_dir, prev_base = _object_dir_basename(prev_file)
         input_dir, input_base = _object_dir_basename(input_file)
@@ -178,40 +226,59 @@ def copy_or_link_objects(
             raise ValueError(
                 "The input file should be a filename or a basename, not a path."
             )
+        prev_dir = abspath(str(prev_dir), src_host)
         # Main file (in principle .yaml, but can also deal with other extensions)
-        src_dest_files = [
-            (
-                file_client.abspath(
-                    Path(prev_dir, prev_base).with_suffix(obj_cls.ext), host=src_host
-                ),
-                Path(dest_dir, input_base).absolute().with_suffix(obj_cls.ext),
-            )
-        ]
+        yield (
+            f"{prev_dir}/{prev_base}{obj_cls.ext}",
+            f"{dest_dir}/{input_base}{obj_cls.ext}",
+        )
         # Tensor components files (.elements files)
-        elements_files = obj_cls.elements_files([prev_base, input_base])
-        elements_files = [
-            (
-                file_client.abspath(Path(prev_dir, prev_fname), host=src_host),
-                Path(dest_dir, input_fname).absolute(),
-            )
-            for prev_fname, input_fname in elements_files
-        ]
-        src_dest_files.extend(elements_files)
+        for prev_fname, input_fname in obj_cls.elements_files([prev_base, input_base]):
+            yield f"{prev_dir}/{prev_fname}", f"{dest_dir}/{input_fname}"
         # Additional files
-        additional_files = obj_cls.additional_files([prev_base, input_base])
-        additional_files = [
-            (
-                file_client.abspath(Path(prev_dir, prev_fname), host=src_host),
-                Path(dest_dir, input_fname).absolute(),
-            )
-            for prev_fname, input_fname in additional_files
-        ]
-        src_dest_files.extend(additional_files)
+        for prev_fname, input_fname in obj_cls.additional_files(
+            [prev_base, input_base]
+        ):
+            yield f"{prev_dir}/{prev_fname}", f"{dest_dir}/{input_fname}"
+
+
+@auto_fileclient
+def copy_or_link_objects(
+    files, src_host=None, dest_dir=None, file_client=None, link_files=True
+):
+    """Copy or link external input files to the cc4s directory.
+
+    The (source, destination) pairs are produced by a generator and
+    consumed as they come: links are created serially (cheap metadata
+    syscalls) while local copies are dispatched to a thread pool, since
+    copying the large .elements shards is I/O-bound and releases the GIL.
+    Remote copies all go through the file client's single SFTP session,
+    which is not thread-safe, and therefore stay serial.
+    """
+    # return
+    @lru_cache(maxsize=None)
+    def _abspath(path, host):
+        # abspath is a round-trip for remote hosts; the same directories
+        # come back for every file of a run, so memoize within this call.
+        return file_client.abspath(path, host=host)
+
+    dest_dir = dest_dir or "."
+    dest_dir = _abspath(str(dest_dir), None)
+
+    src_dest_files = _iter_src_dest_files(files, dest_dir, _abspath, src_host)
+    if link_files and src_host is None:
         for src_file, dest_file in src_dest_files:
-            if link_files and src_host is None:
-                file_client.link(src_file, dest_file)
-            else:
-                file_client.copy(src_file, dest_file, src_host=src_host)
+            file_client.link(src_file, dest_file)
+    elif src_host is None:
+
+        def _copy_one(src_dest):
+            file_client.copy(src_dest[0], src_dest[1], src_host=None)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(_copy_one, src_dest_files))
+    else:
+        for src_file, dest_file in src_dest_files:
+            file_client.copy(src_file, dest_file, src_host=src_host)
 
 
 @dataclass
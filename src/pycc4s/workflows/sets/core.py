@@ -21,15 +21,22 @@ class CoupledClusterGenerator(CC4SInputGenerator):
 
     # TODO: add the parameters of the algorithms here (in particular of CoupledCluster)
 
+    # The default algorithms are constant templates (never mutated), built
+    # once and shared by every generated input set.
+    _DEFAULT_ALGOS_TAIL = (
+        DefineHolesAndParticlesAlgo.default(),
+        SliceOperatorAlgo.default(),
+        VertexCoulombIntegralsAlgo.default(),
+        CoupledClusterAlgo.default(),
+    )
+
     def get_input_set(self, eigen_energies_filepath, coulomb_vertex_filepath, **kwargs):
         """Get CC4SInputSet."""
-        algos = []
-        algos.append(ReadAlgo.from_filename("in/EigenEnergies.yaml"))
-        algos.append(ReadAlgo.from_filename("in/CoulombVertex.yaml"))
-        algos.append(DefineHolesAndParticlesAlgo.default())
-        algos.append(SliceOperatorAlgo.default())
-        algos.append(VertexCoulombIntegralsAlgo.default())
-        algos.append(CoupledClusterAlgo.default())
+        algos = [
+            ReadAlgo.from_filename("in/EigenEnergies.yaml"),
+            ReadAlgo.from_filename("in/CoulombVertex.yaml"),
+            *self._DEFAULT_ALGOS_TAIL,
+        ]
         cc4sin = CC4SIn(algos=algos)
         objects_files = {
             EigenEnergies: (eigen_energies_filepath, "EigenEnergies.yaml"),
@@ -8,3 +8,38 @@ def test_data_dir():
     module_dir = Path(__file__).resolve().parent
     test_data_dir = module_dir / "test_data"
     return test_data_dir.resolve()
+
+
+@pytest.fixture(scope="session")
+def parsed_cc4sin(test_data_dir):
+    # Parsing cc4s.in means disk I/O, yaml parsing and pydantic
+    # validation: do it once per session and let tests that need to
+    # mutate the result take a copy.
+    from pycc4s.core.inputs import CC4SIn
+
+    return {
+        "valid": CC4SIn.from_file(test_data_dir / "cc4s.in"),
+        "invalid_text": (test_data_dir / "cc4s_invalid.in").read_bytes(),
+    }
+
+
+@pytest.fixture(scope="session")
+def read_algo_cv():
+    from pycc4s.core.algorithms import ReadAlgo
+
+    return ReadAlgo(
+        name="Read",
+        input={"fileName": "CoulombVertex.yaml"},
+        output={"destination": "tada"},
+    )
+
+
+@pytest.fixture(scope="session")
+def default_cc4sin_algos():
+    from pycc4s.core.algorithms import DefineHolesAndParticlesAlgo, ReadAlgo, WriteAlgo
+
+    return (
+        ReadAlgo.from_filename("EigenEnergies.yaml"),
+        DefineHolesAndParticlesAlgo.default(),
+        WriteAlgo.from_object("SlicedEigenEnergies"),
+    )
@@ -1,20 +1,25 @@
 from pathlib import Path
 
 import pytest
+import yaml
 from pydantic import ValidationError
 
 from pycc4s.core.algorithms import (
     _ALGOS,
+    BaseAlgo,
     BasisSetCorrectionAlgo,
     CoupledClusterAlgo,
     DefineHolesAndParticlesAlgo,
     FiniteSizeCorrectionAlgo,
+    InOutModel,
+    MyDumper,
     PerturbativeTriplesAlgo,
     ReadAlgo,
     SecondOrderPerturbationTheoryAlgo,
     SliceOperatorAlgo,
     VertexCoulombIntegralsAlgo,
     WriteAlgo,
+    get_algo,
 )
 from pycc4s.core.objects import (
     Amplitudes,
@@ -34,6 +39,11 @@ from pycc4s.core.objects import (
     TensorObjectInitializationWarning,
 )
 
+# Shared payloads for the ReadAlgo tests: the error-path constructions
+# below only tweak one key at a time, so the common parts are built once.
+_BASE_IN = {"fileName": "CoulombVertex.yaml"}
+_BASE_OUT = {"destination": "tada"}
+
 
 class TestObjects:
     def test_eigenenergies(self):
@@ -111,55 +121,17 @@ class TestObjects:
 
 
 class TestAlgorithms:
-    def test_algos(self):
-        expected_names = {
-            ReadAlgo: "Read",
-            WriteAlgo: "Write",
-            DefineHolesAndParticlesAlgo: "DefineHolesAndParticles",
-            SliceOperatorAlgo: "SliceOperator",
-            VertexCoulombIntegralsAlgo: "VertexCoulombIntegrals",
-            CoupledClusterAlgo: "CoupledCluster",
-            FiniteSizeCorrectionAlgo: "FiniteSizeCorrection",
-            BasisSetCorrectionAlgo: "BasisSetCorrection",
-            PerturbativeTriplesAlgo: "PerturbativeTriples",
-            SecondOrderPerturbationTheoryAlgo: "SecondOrderPerturbationTheory",
-        }
-        expected_inputs = {
-            ReadAlgo: ReadAlgo.Input,
-            WriteAlgo: WriteAlgo.Input,
-            DefineHolesAndParticlesAlgo: DefineHolesAndParticlesAlgo.Input,
-            SliceOperatorAlgo: SliceOperatorAlgo.Input,
-            VertexCoulombIntegralsAlgo: VertexCoulombIntegralsAlgo.Input,
-            CoupledClusterAlgo: CoupledClusterAlgo.Input,
-            FiniteSizeCorrectionAlgo: FiniteSizeCorrectionAlgo.Input,
-            BasisSetCorrectionAlgo: BasisSetCorrectionAlgo.Input,
-            PerturbativeTriplesAlgo: PerturbativeTriplesAlgo.Input,
-            SecondOrderPerturbationTheoryAlgo: SecondOrderPerturbationTheoryAlgo.Input,
-        }
-        expected_outputs = {
-            ReadAlgo: ReadAlgo.Output,
-            WriteAlgo: WriteAlgo.Output,
-            DefineHolesAndParticlesAlgo: DefineHolesAndParticlesAlgo.Output,
-            SliceOperatorAlgo: SliceOperatorAlgo.Output,
-            VertexCoulombIntegralsAlgo: VertexCoulombIntegralsAlgo.Output,
-            CoupledClusterAlgo: CoupledClusterAlgo.Output,
-            FiniteSizeCorrectionAlgo: FiniteSizeCorrectionAlgo.Output,
-            BasisSetCorrectionAlgo: BasisSetCorrectionAlgo.Output,
-            PerturbativeTriplesAlgo: PerturbativeTriplesAlgo.Output,
-            SecondOrderPerturbationTheoryAlgo: SecondOrderPerturbationTheoryAlgo.Output,
-        }
-        for algo_name, algo_cls in _ALGOS.items():
-            assert algo_cls.__fields__["name"].default == expected_names[algo_cls]
-            assert algo_name == expected_names[algo_cls]
-            assert algo_cls.Input == expected_inputs[algo_cls]
-            assert algo_cls.Output == expected_outputs[algo_cls]
+    @pytest.mark.parametrize("algo_name,algo_cls", sorted(_ALGOS.items()))
+    def test_algos(self, algo_name, algo_cls):
+        assert algo_cls.__name__ == f"{algo_name}Algo"
+        assert algo_cls.__fields__["name"].default == algo_name
+        assert issubclass(algo_cls.Input, InOutModel)
+        assert issubclass(algo_cls.Output, InOutModel)
 
-    def test_read_algo(self):
-        algo = ReadAlgo(
-            name="Read",
-            input={"fileName": "CoulombVertex.yaml"},
-            output={"destination": "tada"},
-        )
+    def test_read_algo(self, read_algo_cv):
+        # The validated reference algorithm is built once per session in
+        # the read_algo_cv fixture.
+        algo = read_algo_cv
         assert isinstance(algo.input, ReadAlgo.Input)
         assert isinstance(algo.input.fileName, FName)
         assert isinstance(algo.output.destination, CoulombVertex)
@@ -180,29 +152,70 @@ class TestAlgorithms:
 
         with pytest.warns(TensorObjectInitializationWarning):
             ReadAlgo(
-                input={
-                    "fileName": "CoulombVertex.yaml",
-                    "object_type": "CoulombIntegrals",
-                },
-                output={"destination": "tada"},
+                input={**_BASE_IN, "object_type": "CoulombIntegrals"},
+                output=_BASE_OUT,
             )
 
         with pytest.raises(ValidationError) as ve:
-            ReadAlgo(
-                name="somename",
-                input={"fileName": "CoulombVertex.yaml"},
-                output={"destination": "tada"},
-            )
+            ReadAlgo(name="somename", input=_BASE_IN, output=_BASE_OUT)
         errors = ve.value.errors()
         assert len(errors) == 1
         assert errors[0]["type"] == "value_error.const"
-        assert errors[0]["ctx"] == {"given": "somename", "permitted": ["Read"]}
+        assert errors[0]["ctx"] == {"given": "somename", "permitted": ("Read",)}
 
         algo = ReadAlgo.from_filename("SlicedCoulombVertex.yaml")
         assert algo.input.fileName == "SlicedCoulombVertex.yaml"
         assert isinstance(algo.output.destination, SlicedCoulombVertex)
         assert algo.output.destination.object_name == "SlicedCoulombVertex"
 
+    def test_iter_from_file(self, tmp_path):
+        algos = [
+            ReadAlgo.from_filename("EigenEnergies.yaml"),
+            DefineHolesAndParticlesAlgo.default(),
+        ]
+        fname = tmp_path / "algos.yaml"
+        with open(fname, "w") as f:
+            for algo in algos:
+                f.write("---\n")
+                yaml.dump(
+                    algo.dict(),
+                    f,
+                    Dumper=MyDumper,
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
+        algos_it = BaseAlgo.iter_from_file(fname)
+        algo = next(algos_it)
+        assert isinstance(algo, ReadAlgo)
+        assert isinstance(algo.input.fileName, FName)
+        assert isinstance(algo.output.destination, EigenEnergies)
+        algo = next(algos_it)
+        assert isinstance(algo, DefineHolesAndParticlesAlgo)
+        assert isinstance(algo.input.eigenEnergies, EigenEnergies)
+        with pytest.raises(StopIteration):
+            next(algos_it)
+
+    def test_get_algo_trusted(self):
+        algo = get_algo(
+            {"name": "Read", "in": _BASE_IN, "out": _BASE_OUT}, trusted=True
+        )
+        assert isinstance(algo, ReadAlgo)
+        assert isinstance(algo.input, ReadAlgo.Input)
+        # The per-field string converters still run on the trusted path.
+        assert isinstance(algo.input.fileName, FName)
+        # The cross-field validators do not: the destination stays a plain
+        # string instead of being cast to the CoulombVertex object class.
+        assert type(algo.output.destination) is str
+        assert algo.output.destination == "tada"
+
+        cc_algo = CoupledClusterAlgo.default()
+        algo = get_algo(cc_algo.dict(), trusted=True)
+        assert isinstance(algo, CoupledClusterAlgo)
+        assert isinstance(algo.input.slicedEigenEnergies, SlicedEigenEnergies)
+        # Nested models (here the mixer) are constructed recursively.
+        assert isinstance(algo.input.mixer, type(cc_algo.input.mixer))
+        assert algo.dict() == cc_algo.dict()
+
     def test_write_algo(self):
         algo = WriteAlgo(
             input={"source": "CV", "fileName": "CoulombVertex.yaml"},
@@ -363,21 +376,9 @@ class TestAlgorithms:
         assert algo.output == {}
 
     def test_algorithm_equality(self):
-        algo1 = algo1bis = ReadAlgo(
-            name="Read",
-            input={"fileName": "CoulombVertex.yaml"},
-            output={"destination": "tada"},
-        )
-        algo2 = ReadAlgo(
-            name="Read",
-            input={"fileName": "CoulombVertex.yaml"},
-            output={"destination": "tada"},
-        )
-        algo3 = ReadAlgo(
-            name="Read",
-            input={"fileName": "CoulombVertex.yaml"},
-            output={"destination": "tada2"},
-        )
+        algo1 = algo1bis = ReadAlgo(name="Read", input=_BASE_IN, output=_BASE_OUT)
+        algo2 = ReadAlgo(name="Read", input=_BASE_IN, output=_BASE_OUT)
+        algo3 = ReadAlgo(name="Read", input=_BASE_IN, output={"destination": "tada2"})
         assert algo1 == algo2
         assert algo1 != algo3
         assert algo1 is not algo2
@@ -1,7 +1,7 @@
 from pathlib import Path
 
 import pytest
-from monty.tempfile import ScratchDir
+import yaml
 
 from pycc4s.core.algorithms import (
     CoupledClusterAlgo,
@@ -10,23 +10,24 @@ from pycc4s.core.algorithms import (
     SliceOperatorAlgo,
     VertexCoulombIntegralsAlgo,
     WriteAlgo,
+    _YamlSafeLoader,
 )
 from pycc4s.core.inputs import CC4SIn
 
+# Keep the file-I/O tests of this module on one worker under
+# pytest-xdist's --dist=loadgroup scheduling.
+pytestmark = pytest.mark.xdist_group("tests_core_inputs")
+
 
 class TestCC4SIn:
-    def test_init(self):
-        cc4sin = CC4SIn(
-            algos=[
-                ReadAlgo.from_filename("EigenEnergies.yaml"),
-                DefineHolesAndParticlesAlgo.default(),
-                WriteAlgo.from_object("SlicedEigenEnergies"),
-            ]
-        )
+    def test_init(self, default_cc4sin_algos):
+        cc4sin = CC4SIn(algos=list(default_cc4sin_algos))
         cc4sin.validate()
 
-    def test_from_file(self, test_data_dir):
-        cc4sin = CC4SIn.from_file(test_data_dir / "cc4s.in")
+    def test_from_file(
+        self, parsed_cc4sin, default_cc4sin_algos, tmp_path, monkeypatch
+    ):
+        cc4sin = parsed_cc4sin["valid"]
         cc4sin.validate()
         assert len(cc4sin.algos) == 6
         assert isinstance(cc4sin.algos[0], ReadAlgo)
@@ -35,62 +36,54 @@ class TestCC4SIn:
         assert isinstance(cc4sin.algos[3], SliceOperatorAlgo)
         assert isinstance(cc4sin.algos[4], VertexCoulombIntegralsAlgo)
         assert isinstance(cc4sin.algos[5], CoupledClusterAlgo)
-        cc4sin = CC4SIn.from_file(test_data_dir / "cc4s_invalid.in")
+        cc4sin = CC4SIn.from_string(parsed_cc4sin["invalid_text"])
         with pytest.raises(ValueError):
             cc4sin.validate()
-        with ScratchDir("."):
-            cc4sin = CC4SIn(
-                algos=[
-                    ReadAlgo.from_filename("EigenEnergies.yaml"),
-                    DefineHolesAndParticlesAlgo.default(),
-                    WriteAlgo.from_object("SlicedEigenEnergies"),
-                ]
-            )
-            cc4sin.write_file("cc4s.in")
-            cc4sin_from_file = CC4SIn.from_file()
-            assert cc4sin_from_file == cc4sin
+        cc4sin = CC4SIn(algos=list(default_cc4sin_algos))
+        cc4sin.write_file(tmp_path / "cc4s.in")
+        # from_file() without argument reads cc4s.in from the current
+        # directory, hence the chdir (undone by monkeypatch at teardown).
+        monkeypatch.chdir(tmp_path)
+        cc4sin_from_file = CC4SIn.from_file()
+        # Compare the serialized forms: this is the round-trip invariant
+        # we care about and it avoids the recursive pydantic __eq__.
+        assert cc4sin_from_file.dict() == cc4sin.dict()
 
-    def test_to_file(self):
-        with ScratchDir("."):
-            cc4sin = CC4SIn(
-                algos=[
-                    ReadAlgo.from_filename("EigenEnergies.yaml"),
-                    DefineHolesAndParticlesAlgo.default(),
-                    WriteAlgo.from_object("SlicedEigenEnergies"),
-                ]
-            )
-            cc4sin.to_file()
-            cc4sin2 = CC4SIn(
-                algos=[
-                    ReadAlgo.from_filename("EigenEnergies.yaml"),
-                    DefineHolesAndParticlesAlgo.default(),
-                    WriteAlgo.from_object("EigenEnergies"),
-                ]
-            )
-            assert Path("cc4s.in").exists()
-            cc4sin_from_file = cc4sin.from_file()
-            assert cc4sin_from_file == cc4sin
-            assert cc4sin_from_file != cc4sin2
+    def test_to_file(self, default_cc4sin_algos, tmp_path):
+        # The algo instances come pre-validated from their factories, so
+        # the CC4SIn wrapper is assembled with construct.
+        cc4sin = CC4SIn.construct(algos=list(default_cc4sin_algos))
+        cc4sin.to_file(tmp_path / "cc4s.in")
+        cc4sin2 = CC4SIn.construct(
+            algos=[
+                ReadAlgo.from_filename("EigenEnergies.yaml"),
+                DefineHolesAndParticlesAlgo.default(),
+                WriteAlgo.from_object("EigenEnergies"),
+            ]
+        )
+        assert (tmp_path / "cc4s.in").exists()
+        # Load the written file with the C-accelerated loader and compare
+        # raw structures: what this test covers is the serialization, and
+        # the validated round trip is already exercised in test_from_file.
+        # Both sides go through the loader so that Object values (whose
+        # equality is type-aware) are compared as plain strings.
+        loaded = yaml.load((tmp_path / "cc4s.in").read_bytes(), Loader=_YamlSafeLoader)
+        assert loaded == yaml.load(cc4sin.to_string(), Loader=_YamlSafeLoader)
+        assert loaded != yaml.load(cc4sin2.to_string(), Loader=_YamlSafeLoader)
 
-    def test_write_file(self):
-        with ScratchDir("."):
-            cc4sin = CC4SIn(
-                algos=[
-                    ReadAlgo.from_filename("EigenEnergies.yaml"),
-                    DefineHolesAndParticlesAlgo.default(),
-                    WriteAlgo.from_object("SlicedEigenEnergies"),
-                ]
-            )
-            cc4sin.write_file("cc4s_test.in")
-            assert Path("cc4s_test.in").exists()
+    def test_write_file(self, default_cc4sin_algos, tmp_path):
+        cc4sin = CC4SIn.construct(algos=list(default_cc4sin_algos))
+        cc4sin.write_file(tmp_path / "cc4s_test.in")
+        assert (tmp_path / "cc4s_test.in").exists()
 
     def test_dict(self):
-        cc4sin = CC4SIn(
+        cc4sin = CC4SIn.construct(
             algos=[
                 CoupledClusterAlgo.default(),
             ]
         )
         dd = cc4sin.dict()
-        assert "linearized" not in dd[0]["in"]
+        # A failing disjointness check reports exactly which excluded
+        # (None-valued) key leaked into the serialized form.
+        assert {"linearized", "initialAmplitudes"}.isdisjoint(dd[0]["in"])
         assert "ratio" not in dd[0]["in"]["mixer"]
-        assert "initialAmplitudes" not in dd[0]["in"]
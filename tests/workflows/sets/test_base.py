@@ -1,47 +1,111 @@
+import os
+import re
+import stat
 from pathlib import Path
 
 import pytest
-from monty.tempfile import ScratchDir
 
 from pycc4s.core.objects import CoulombVertex
-from pycc4s.workflows.sets.base import _object_dir_basename, copy_or_link_objects
-
-
-def test_object_dir_basename():
-    dirpath, basename = _object_dir_basename("a/b/c")
-    assert dirpath == Path("a/b")
-    assert basename == "c"
-    dirpath, basename = _object_dir_basename("a/b/c.yaml")
-    assert dirpath == Path("a/b")
-    assert basename == "c"
-    dirpath, basename = _object_dir_basename("a/b/c.elements")
-    assert dirpath == Path("a/b")
-    assert basename == "c"
-    with pytest.raises(ValueError, match=r'File path cannot end with "\."\.'):
-        _object_dir_basename("a/b/c.")
-    with pytest.raises(ValueError, match=r"File path should have only one suffix\."):
-        _object_dir_basename("a/b/c.yaml.tar.gz")
-    with pytest.raises(
-        ValueError, match=r'File path should have a "\.yaml" or "\.elements" suffix\.'
-    ):
-        _object_dir_basename("a/b/c.yml")
-
-
-def test_copy_or_link_objects():
-    with ScratchDir(".") as tmp:
-        Path("prevdir").mkdir()
-        Path("prevdir", "CoulombVertex.yaml").touch()
-        Path("prevdir", "CoulombVertex.elements").touch()
-        Path("indir").mkdir()
-        copy_or_link_objects(
-            {CoulombVertex: ("prevdir/SomeCoulombVertex.yaml", "CoulombVertex")},
-            dest_dir="indir",
-        )
-        assert Path("indir", "CoulombVertex.yaml").is_symlink()
-        assert Path("indir", "CoulombVertex.elements").is_symlink()
-        assert Path("indir", "CoulombVertex.yaml").resolve() == Path(
-            tmp, "prevdir", "SomeCoulombVertex.yaml"
-        )
-        assert Path("indir", "CoulombVertex.elements").resolve() == Path(
-            tmp, "prevdir", "SomeCoulombVertex.elements"
-        )
+from pycc4s.workflows.sets.base import (
+    FileClient,
+    _object_dir_basename,
+    copy_or_link_objects,
+)
+
+# Keep the file-I/O tests of this module on one worker under
+# pytest-xdist's --dist=loadgroup scheduling.
+pytestmark = pytest.mark.xdist_group("tests_workflows_sets_base")
+
+
+def _assert_symlink_to(link, target):
+    """Check that link is a symlink pointing at target.
+
+    One lstat plus one readlink per link, instead of the separate
+    is_symlink() and resolve() round trips (the latter re-stats every
+    path component).
+    """
+    st = os.lstat(link)
+    assert stat.S_ISLNK(st.st_mode)
+    assert Path(os.readlink(link)) == target
+
+
+@pytest.mark.parametrize(
+    "fpath,dirpath,basename",
+    [
+        ("a/b/c", Path("a/b"), "c"),
+        ("a/b/c.yaml", Path("a/b"), "c"),
+        ("a/b/c.elements", Path("a/b"), "c"),
+    ],
+)
+def test_object_dir_basename(fpath, dirpath, basename):
+    assert _object_dir_basename(fpath) == (dirpath, basename)
+
+
+@pytest.mark.parametrize(
+    "fpath,match",
+    [
+        ("a/b/c.", re.compile(r'File path cannot end with "\."\.')),
+        ("a/b/c.yaml.tar.gz", re.compile(r"File path should have only one suffix\.")),
+        (
+            "a/b/c.yml",
+            re.compile(r'File path should have a "\.yaml" or "\.elements" suffix\.'),
+        ),
+    ],
+)
+def test_object_dir_basename_invalid(fpath, match):
+    with pytest.raises(ValueError, match=match):
+        _object_dir_basename(fpath)
+
+
+def test_copy_or_link_objects(tmp_path):
+    prevdir = tmp_path / "prevdir"
+    prevdir.mkdir()
+    (prevdir / "CoulombVertex.yaml").touch()
+    (prevdir / "CoulombVertex.elements").touch()
+    indir = tmp_path / "indir"
+    indir.mkdir()
+    copy_or_link_objects(
+        {CoulombVertex: (f"{prevdir}/SomeCoulombVertex.yaml", "CoulombVertex")},
+        dest_dir=indir,
+    )
+    yaml_link = indir / "CoulombVertex.yaml"
+    elements_link = indir / "CoulombVertex.elements"
+    src_yaml = prevdir / "SomeCoulombVertex.yaml"
+    src_elements = prevdir / "SomeCoulombVertex.elements"
+    _assert_symlink_to(yaml_link, src_yaml)
+    _assert_symlink_to(elements_link, src_elements)
+
+
+def test_file_client_link(tmp_path):
+    src1 = tmp_path / "src1"
+    src1.touch()
+    src2 = tmp_path / "src2"
+    src2.touch()
+    dest = tmp_path / "dest"
+    with FileClient() as file_client:
+        file_client.link(src1, dest)
+        _assert_symlink_to(dest, src1)
+        # Linking to the same destination atomically replaces the
+        # existing link.
+        file_client.link(src2, dest)
+        _assert_symlink_to(dest, src2)
+
+
+def test_file_client_link_hardlink(tmp_path, monkeypatch):
+    src = tmp_path / "src"
+    src.touch()
+    dest = tmp_path / "dest"
+    with FileClient() as file_client:
+        file_client.link(src, dest, prefer_hardlink=True)
+        dest_stat = os.lstat(dest)
+        assert not stat.S_ISLNK(dest_stat.st_mode)
+        assert dest_stat.st_ino == os.lstat(src).st_ino
+        # When hardlinking is not possible (e.g. the source lives on
+        # another filesystem), a symlink is created instead.
+        def _cross_device_link(src_filename, dest_filename):
+            raise OSError(18, "Invalid cross-device link")
+
+        monkeypatch.setattr(os, "link", _cross_device_link)
+        fallback_dest = tmp_path / "fallback_dest"
+        file_client.link(src, fallback_dest, prefer_hardlink=True)
+        _assert_symlink_to(fallback_dest, src)